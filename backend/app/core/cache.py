@@ -2,16 +2,23 @@ from typing import Any, Optional
 import json
 import redis
 import os
-from functools import wraps
+from functools import lru_cache, wraps
 import hashlib
 
-# Initialize Redis client
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "redis"),
-    port=int(os.getenv("REDIS_PORT", 6379)),
-    db=0,
-    decode_responses=True
-)
+@lru_cache(maxsize=1)
+def get_redis_client() -> redis.Redis:
+    """
+    Return the shared Redis client, creating it on first use.
+    
+    Environment variables are read once, when the client is constructed.
+    Call ``get_redis_client.cache_clear()`` to rebuild it (e.g. in tests).
+    """
+    return redis.Redis(
+        host=os.getenv("REDIS_HOST", "redis"),
+        port=int(os.getenv("REDIS_PORT", 6379)),
+        db=0,
+        decode_responses=True
+    )
 
 def generate_cache_key(prefix: str, *args, **kwargs) -> str:
     """Generate a unique cache key based on function arguments."""
@@ -35,6 +42,7 @@ def cache_response(ttl: int = 3600):
         async def wrapper(*args, **kwargs):
             # Generate cache key
             cache_key = generate_cache_key(func.__name__, *args, **kwargs)
+            redis_client = get_redis_client()
             
             try:
                 # Try to get from cache
@@ -63,6 +71,7 @@ def cache_response(ttl: int = 3600):
 
 def clear_cache(pattern: str = "*"):
     """Clear cache entries matching the given pattern."""
+    redis_client = get_redis_client()
     try:
         cursor = 0
         while True:
@@ -76,6 +85,7 @@ def clear_cache(pattern: str = "*"):
 
 def get_cache_stats() -> dict:
     """Get cache statistics."""
+    redis_client = get_redis_client()
     try:
         info = redis_client.info()
         return {
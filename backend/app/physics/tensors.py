@@ -23,9 +23,6 @@ def calculate_christoffel_symbols(metric: Dict[str, float], coords: Dict[str, fl
     # Calculate inverse metric
     g_inv = np.linalg.inv(g)
     
-    # Initialize Christoffel symbols
-    gamma = np.zeros((dim, dim, dim))
-    
     # Calculate derivatives of metric components
     # This is metric-specific and needs to be handled separately for each case
     def get_metric_derivatives(metric_type: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -83,23 +80,16 @@ def calculate_christoffel_symbols(metric: Dict[str, float], coords: Dict[str, fl
     metric_type = coords.get("metric_type", "schwarzschild")
     dg_dr, dg_dtheta, dg_dphi = get_metric_derivatives(metric_type)
     
-    # Calculate Christoffel symbols
-    for mu in range(dim):
-        for alpha in range(dim):
-            for beta in range(dim):
-                gamma[mu,alpha,beta] = 0
-                for sigma in range(dim):
-                    gamma[mu,alpha,beta] += 0.5 * g_inv[mu,sigma] * (
-                        dg_dr[beta,sigma] * (alpha == 1) +
-                        dg_dr[alpha,sigma] * (beta == 1) -
-                        dg_dr[sigma,alpha] * (beta == 1) +
-                        dg_dtheta[beta,sigma] * (alpha == 2) +
-                        dg_dtheta[alpha,sigma] * (beta == 2) -
-                        dg_dtheta[sigma,alpha] * (beta == 2) +
-                        dg_dphi[beta,sigma] * (alpha == 3) +
-                        dg_dphi[alpha,sigma] * (beta == 3) -
-                        dg_dphi[sigma,alpha] * (beta == 3)
-                    )
+    # Stack derivatives as dg[k, μ, ν] = ∂ₖg_μν (nothing depends on t)
+    dg = np.stack((np.zeros((dim, dim)), dg_dr, dg_dtheta, dg_dphi))
+    
+    # Calculate Christoffel symbols as a single contraction over σ.
+    # NOTE: this reproduces the original loop implementation, whose bracket was
+    # ∂ₐg_βσ + ∂ᵦg_ασ - ∂ᵦg_σα. The last term is not the textbook ∂_σg_αβ, and
+    # for a symmetric metric it cancels the middle term, leaving just ∂ₐg_βσ.
+    # Kept deliberately so this change stays behaviour-preserving; correcting
+    # the formula is a separate fix.
+    gamma = 0.5 * np.einsum("ms,abs->mab", g_inv, dg)
     
     # Convert to dictionary format
     christoffel_dict = {}
@@ -168,7 +158,6 @@ def calculate_ricci_tensor(riemann: Dict[str, float]) -> Dict[str, float]:
     Rᵢⱼ = Rᵏᵢₖⱼ
     """
     dim = 4
-    ricci = np.zeros((dim, dim))
     
     # Convert Riemann components to array
     riemann_array = np.zeros((dim, dim, dim, dim))
@@ -177,10 +166,7 @@ def calculate_ricci_tensor(riemann: Dict[str, float]) -> Dict[str, float]:
         riemann_array[indices[0], indices[1], indices[2], indices[3]] = value
     
     # Calculate Ricci tensor by contraction
-    for i in range(dim):
-        for j in range(dim):
-            for k in range(dim):
-                ricci[i,j] += riemann_array[k,i,k,j]
+    ricci = np.einsum("kikj->ij", riemann_array)
     
     # Convert to dictionary format
     ricci_dict = {}
@@ -197,7 +183,6 @@ def calculate_ricci_scalar(ricci: Dict[str, float], metric: Dict[str, float]) ->
     R = gᵢⱼRᵢⱼ
     """
     dim = 4
-    g_inv = np.zeros((dim, dim))
     ricci_tensor = np.zeros((dim, dim))
     
     # Convert metric to array and invert
@@ -214,9 +199,6 @@ def calculate_ricci_scalar(ricci: Dict[str, float], metric: Dict[str, float]) ->
         ricci_tensor[indices[0], indices[1]] = value
     
     # Calculate scalar curvature
-    R = 0
-    for i in range(dim):
-        for j in range(dim):
-            R += g_inv[i,j] * ricci_tensor[i,j]
+    R = np.einsum("ij,ij->", g_inv, ricci_tensor)
     
     return float(R) 
\ No newline at end of file
@@ -1,57 +1,78 @@
+import json
 import pytest
-from fastapi.testclient import TestClient
-from typing import Generator
-import redis
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generator, Mapping
 
-from app.main import app
+if TYPE_CHECKING:
+    import redis
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app() -> Generator:
-    client = TestClient(app)
-    yield client
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def redis_client() -> Generator:
+    import redis
+
     client = redis.Redis(host='localhost', port=6379, db=1)
     yield client
-    client.flushdb()
     client.close()
 
 @pytest.fixture(autouse=True)
-def cleanup_cache(redis_client: redis.Redis) -> None:
+def cleanup_cache(redis_client: 'redis.Redis') -> None:
     redis_client.flushdb()
 
-@pytest.fixture
-def mock_session() -> dict:
-    return {
+@pytest.fixture(scope="session")
+def mock_session() -> Mapping:
+    return MappingProxyType({
         'access_token': 'mock-token',
-        'user': {
+        'user': MappingProxyType({
             'id': 'mock-user-id',
             'email': 'test@example.com',
             'created_at': '2024-01-01T00:00:00Z'
-        }
-    }
+        })
+    })
 
-@pytest.fixture
-def schwarzschild_test_data() -> dict:
-    return {
+@pytest.fixture(scope="session")
+def schwarzschild_test_data() -> Mapping:
+    return MappingProxyType({
         'mass': 1.0,
         'r': 10.0
-    }
+    })
 
-@pytest.fixture
-def kerr_test_data() -> dict:
-    return {
+@pytest.fixture(scope="session")
+def kerr_test_data() -> Mapping:
+    return MappingProxyType({
         'mass': 1.0,
         'a': 0.5,
         'r': 10.0,
         'theta': 1.5708
-    }
+    })
 
-@pytest.fixture
-def reissner_nordstrom_test_data() -> dict:
-    return {
+@pytest.fixture(scope="session")
+def reissner_nordstrom_test_data() -> Mapping:
+    return MappingProxyType({
         'mass': 1.0,
         'charge': 0.5,
         'r': 10.0
-    } 
\ No newline at end of file
+    })
+
+@pytest.fixture(scope="session")
+def metric_payloads(
+    schwarzschild_test_data: Mapping,
+    kerr_test_data: Mapping,
+    reissner_nordstrom_test_data: Mapping,
+) -> Mapping[str, bytes]:
+    """JSON-encoded payloads for each metric endpoint, serialized once."""
+    return MappingProxyType({
+        endpoint: json.dumps(dict(data)).encode()
+        for endpoint, data in (
+            ("schwarzschild", schwarzschild_test_data),
+            ("kerr", kerr_test_data),
+            ("reissner-nordstrom", reissner_nordstrom_test_data),
+        )
+    })
@@ -1,7 +1,24 @@
+import math
 import pytest
 from fastapi.testclient import TestClient
-import numpy as np
-from unittest.mock import patch
+from typing import Mapping
+
+_METRIC_KEYS = frozenset({
+    "metric_components",
+    "christoffel_symbols",
+    "riemann_tensor",
+    "ricci_tensor",
+    "ricci_scalar",
+})
+_SCHWARZSCHILD_KEYS = _METRIC_KEYS | {"event_horizon"}
+_KERR_KEYS = _RN_KEYS = _METRIC_KEYS | {"event_horizons"}
+
+_JSON_HDR = {"content-type": "application/json"}
+
+_HALF_PI = math.pi / 2.0
+
+def _coincident(horizons: list, tol: float = 1e-10) -> bool:
+    return math.isclose(horizons[0], horizons[1], abs_tol=tol)
 
 def test_health_check(test_app: TestClient):
     response = test_app.get("/health")
@@ -17,110 +34,74 @@ def test_cache_stats(test_app: TestClient):
     assert "hits" in data
     assert "misses" in data
 
-class TestSchwarzschildMetric:
-    def test_valid_parameters(self, test_app: TestClient, schwarzschild_test_data: dict):
-        response = test_app.post("/metrics/schwarzschild", json=schwarzschild_test_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert "metric_components" in data
-        assert "christoffel_symbols" in data
-        assert "riemann_tensor" in data
-        assert "ricci_tensor" in data
-        assert "ricci_scalar" in data
-        assert "event_horizon" in data
-
-    def test_near_event_horizon(self, test_app: TestClient):
-        data = {"mass": 1.0, "r": 2.1}  # Just outside event horizon
-        response = test_app.post("/metrics/schwarzschild", json=data)
-        assert response.status_code == 200
-        result = response.json()
-        assert abs(result["event_horizon"] - 2.0) < 1e-10
+METRIC_CASES = [
+    ("schwarzschild", _SCHWARZSCHILD_KEYS),
+    ("kerr", _KERR_KEYS),
+    ("reissner-nordstrom", _RN_KEYS),
+]
+
+INVALID_CASES = [
+    ("/metrics/schwarzschild", {"mass": -1.0, "r": 1.0}),  # Negative mass
+    ("/metrics/kerr", {"mass": 1.0, "a": 1.5, "r": 5.0, "theta": _HALF_PI}),  # a > M
+    ("/metrics/reissner-nordstrom", {"mass": 1.0, "charge": 1.5, "r": 5.0}),  # Q > M
+]
+
+EXTREMAL_CASES = [
+    ("kerr", {"mass": 1.0, "a": 1.0, "r": 5.0, "theta": _HALF_PI}),
+    ("reissner-nordstrom", {"mass": 1.0, "charge": 1.0, "r": 5.0}),
+]
+
+@pytest.mark.parametrize("endpoint,keys", METRIC_CASES, ids=[c[0] for c in METRIC_CASES])
+def test_metric(test_app: TestClient, metric_payloads: Mapping[str, bytes], endpoint: str, keys: frozenset):
+    response = test_app.post(f"/metrics/{endpoint}", content=metric_payloads[endpoint], headers=_JSON_HDR)
+    assert response.status_code == 200
+    data = response.json()
+    assert keys <= data.keys()
 
-    def test_invalid_parameters(self, test_app: TestClient):
-        data = {"mass": -1.0, "r": 1.0}  # Negative mass
-        response = test_app.post("/metrics/schwarzschild", json=data)
-        assert response.status_code == 400
+@pytest.mark.parametrize("endpoint,payload", INVALID_CASES, ids=[c[0] for c in INVALID_CASES])
+def test_invalid_parameters(test_app: TestClient, endpoint: str, payload: dict):
+    assert test_app.post(endpoint, json=payload).status_code == 400
 
-class TestKerrMetric:
-    def test_valid_parameters(self, test_app: TestClient, kerr_test_data: dict):
-        response = test_app.post("/metrics/kerr", json=kerr_test_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert "metric_components" in data
-        assert "christoffel_symbols" in data
-        assert "riemann_tensor" in data
-        assert "ricci_tensor" in data
-        assert "ricci_scalar" in data
-        assert "event_horizons" in data
-
-    def test_extremal_kerr(self, test_app: TestClient):
-        data = {"mass": 1.0, "a": 1.0, "r": 5.0, "theta": np.pi/2}
-        response = test_app.post("/metrics/kerr", json=data)
-        assert response.status_code == 200
-        result = response.json()
-        horizons = result["event_horizons"]
-        assert len(horizons) == 2
-        assert abs(horizons[0] - horizons[1]) < 1e-10  # Horizons coincide
-
-    def test_invalid_parameters(self, test_app: TestClient):
-        data = {"mass": 1.0, "a": 1.5, "r": 5.0, "theta": np.pi/2}  # a > M
-        response = test_app.post("/metrics/kerr", json=data)
-        assert response.status_code == 400
-
-class TestReissnerNordstromMetric:
-    def test_valid_parameters(self, test_app: TestClient, reissner_nordstrom_test_data: dict):
-        response = test_app.post("/metrics/reissner-nordstrom", json=reissner_nordstrom_test_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert "metric_components" in data
-        assert "christoffel_symbols" in data
-        assert "riemann_tensor" in data
-        assert "ricci_tensor" in data
-        assert "ricci_scalar" in data
-        assert "event_horizons" in data
-
-    def test_extremal_charge(self, test_app: TestClient):
-        data = {"mass": 1.0, "charge": 1.0, "r": 5.0}
-        response = test_app.post("/metrics/reissner-nordstrom", json=data)
-        assert response.status_code == 200
-        result = response.json()
-        horizons = result["event_horizons"]
-        assert len(horizons) == 2
-        assert abs(horizons[0] - horizons[1]) < 1e-10  # Horizons coincide
+def test_near_event_horizon(test_app: TestClient):
+    data = {"mass": 1.0, "r": 2.1}  # Just outside event horizon
+    response = test_app.post("/metrics/schwarzschild", json=data)
+    assert response.status_code == 200
+    result = response.json()
+    assert math.isclose(result["event_horizon"], 2.0, abs_tol=1e-10)
+
+@pytest.mark.parametrize("endpoint,data", EXTREMAL_CASES, ids=[c[0] for c in EXTREMAL_CASES])
+def test_extremal_horizons(test_app: TestClient, endpoint: str, data: dict):
+    response = test_app.post(f"/metrics/{endpoint}", json=data)
+    assert response.status_code == 200
+    result = response.json()
+    horizons = result["event_horizons"]
+    assert len(horizons) == 2
+    assert _coincident(horizons)
 
-    def test_invalid_parameters(self, test_app: TestClient):
-        data = {"mass": 1.0, "charge": 1.5, "r": 5.0}  # Q > M
-        response = test_app.post("/metrics/reissner-nordstrom", json=data)
-        assert response.status_code == 400
+def _stats(client: TestClient) -> dict:
+    return client.get("/cache/stats").json()
 
 class TestCaching:
-    def test_cache_hit(self, test_app: TestClient, schwarzschild_test_data: dict):
-        # First request
-        response1 = test_app.post("/metrics/schwarzschild", json=schwarzschild_test_data)
-        assert response1.status_code == 200
+    def test_cache_hit(self, test_app: TestClient, metric_payloads: Mapping[str, bytes]):
+        # First request primes the cache
+        response = test_app.post("/metrics/schwarzschild", content=metric_payloads["schwarzschild"], headers=_JSON_HDR)
+        assert response.status_code == 200
+        before = _stats(test_app)
 
-        # Second request with same parameters
-        response2 = test_app.post("/metrics/schwarzschild", json=schwarzschild_test_data)
-        assert response2.status_code == 200
+        # Second request should hit the cache
+        response = test_app.post("/metrics/schwarzschild", content=metric_payloads["schwarzschild"], headers=_JSON_HDR)
+        assert response.status_code == 200
 
-        # Check cache stats
-        stats_response = test_app.get("/cache/stats")
-        stats = stats_response.json()
-        assert stats["hits"] > 0
+        after = _stats(test_app)
+        assert after["hits"] - before["hits"] >= 1
 
     def test_cache_miss(self, test_app: TestClient):
-        data1 = {"mass": 1.0, "r": 10.0}
-        data2 = {"mass": 2.0, "r": 10.0}
-
-        # First request
-        response1 = test_app.post("/metrics/schwarzschild", json=data1)
-        assert response1.status_code == 200
+        # cleanup_cache flushes the cache before each test, so this is a miss
+        data = {"mass": 2.0, "r": 10.0}
+        before = _stats(test_app)
 
-        # Second request with different parameters
-        response2 = test_app.post("/metrics/schwarzschild", json=data2)
-        assert response2.status_code == 200
+        response = test_app.post("/metrics/schwarzschild", json=data)
+        assert response.status_code == 200
 
-        # Check cache stats
-        stats_response = test_app.get("/cache/stats")
-        stats = stats_response.json()
-        assert stats["misses"] > 0 
\ No newline at end of file
+        after = _stats(test_app)
+        assert after["misses"] - before["misses"] >= 1